@@ -61,6 +61,25 @@ f = loss.SquaredL2Loss(y=y, A=A)
 
 x0 = snp.clip(A.fbp(y), 0, 1.0)
 
+"""
+Define a function constructing a preconditioner for the CG solver used in the
+$\mathbf{x}$-update step, as in the `preconditioned_cg_ct.py` example. Unlike that
+example, the regularization $\gamma$ of the inverse frequency response is specified
+relative to the largest frequency response rather than as an absolute value.
+"""
+
+
+def preconditioner(f, C, rho, gamma=1e-2):
+    # gamma limits the gain of the preconditioner, relative to the largest frequency response
+    H = linop.CircularConvolve.from_operator(f.hessian + rho * C.gram_op)
+    frequency_response = snp.abs(H.h_dft)
+    return linop.CircularConvolve(
+        1 / (frequency_response + gamma * frequency_response.max()), C.input_shape, h_is_dft=True
+    )
+
+
+M = preconditioner(f, C, ρ)
+
 solver = ADMM(
     f=f,
     g_list=[g],
@@ -68,7 +87,7 @@ solver = ADMM(
     rho_list=[ρ],
     x0=x0,
     maxiter=maxiter,
-    subproblem_solver=LinearSubproblemSolver(cg_kwargs={"maxiter": num_inner_iter}),
+    subproblem_solver=LinearSubproblemSolver(cg_kwargs={"maxiter": num_inner_iter, "M": M}),
     verbose=True,
 )
 
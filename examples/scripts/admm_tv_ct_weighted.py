@@ -24,7 +24,7 @@ import jax
 from xdesign import Soil, discrete_phantom
 
 import scico.numpy as snp
-from scico import functional, linop, loss, metric, plot
+from scico import functional, linop, loss, metric, plot, random
 from scico.admm import ADMM, LinearSubproblemSolver
 from scico.linop.radon import ParallelBeamProjector
 
@@ -57,13 +57,13 @@ $$\mathrm{counts} \sim \mathrm{Poi}\left(I_0 exp\left\{- \alpha A \mathbf{x} \ri
 
 $$\mathbf{y} = - \frac{1}{\alpha} \log\left(\mathrm{counts} / I_0\right).$$
 
-We use the NumPy random functionality so we can generate using 64-bit numbers.
+The noise is generated using the JAX random functionality so that the sinogram does not
+need to be copied to the host and back.
 
 """
-counts = np.random.poisson(Io * snp.exp(-alpha * A @ x_gt))
-counts = np.clip(counts, a_min=1, a_max=np.inf)  # Replace any 0s count with 1
-y = -1 / alpha * np.log(counts / Io)
-y = jax.device_put(y)  # Converts back to float32
+counts, key = random.poisson(Io * snp.exp(-alpha * y_c), shape=y_c.shape, seed=0)
+counts = snp.clip(counts, a_min=1)  # Replace any 0s count with 1
+y = -1 / alpha * snp.log(counts / Io)
 
 """
 Setup post processing.
@@ -80,6 +80,25 @@ Compute an FBP reconstruction as an initial guess.
 """
 x0 = postprocess(A.fbp(y))
 
+C = linop.FiniteDifference(x_gt.shape)  # Analysis operator
+
+"""
+Define a function constructing a preconditioner for the CG solver used in the
+$\mathbf{x}$-update step, as in the `preconditioned_cg_ct.py` example. Unlike that
+example, the regularization $\gamma$ of the inverse frequency response is specified
+relative to the largest frequency response rather than as an absolute value.
+"""
+
+
+def preconditioner(f, C, rho, gamma=1e-2):
+    # gamma limits the gain of the preconditioner, relative to the largest frequency response
+    H = linop.CircularConvolve.from_operator(f.hessian + rho * C.gram_op)
+    frequency_response = snp.abs(H.h_dft)
+    return linop.CircularConvolve(
+        1 / (frequency_response + gamma * frequency_response.max()), C.input_shape, h_is_dft=True
+    )
+
+
 """
 Set up and solve the un-weighted reconstruction problem
 
@@ -98,11 +117,13 @@ f = loss.SquaredL2Loss(y=y, A=A)
 admm_unweighted = ADMM(
     f=f,
     g_list=[lambda_unweighted * functional.L1Norm()],
-    C_list=[linop.FiniteDifference(x_gt.shape)],
+    C_list=[C],
     rho_list=[rho],
     x0=x0,
     maxiter=maxiter,
-    subproblem_solver=LinearSubproblemSolver(cg_kwargs={"maxiter": max_inner_iter}),
+    subproblem_solver=LinearSubproblemSolver(
+        cg_kwargs={"maxiter": max_inner_iter, "M": preconditioner(f, C, rho)}
+    ),
     verbose=True,
 )
 admm_unweighted.solve()
@@ -118,6 +139,8 @@ where
 
   $$W = \mathrm{diag}\left\{\exp( \sqrt{\mathbf{y}}) \right\}.$$
 
+The solver is initialized with the solution of the un-weighted problem, which is much closer
+to the solution of the weighted problem than the FBP reconstruction.
 """
 lambda_weighted = 1.14e2
 
@@ -128,11 +151,13 @@ f = loss.WeightedSquaredL2Loss(y=y, A=A, weight_op=W)
 admm_weighted = ADMM(
     f=f,
     g_list=[lambda_weighted * functional.L1Norm()],
-    C_list=[linop.FiniteDifference(x_gt.shape)],
+    C_list=[C],
     rho_list=[rho],
     maxiter=maxiter,
-    x0=x0,
-    subproblem_solver=LinearSubproblemSolver(cg_kwargs={"maxiter": max_inner_iter}),
+    x0=admm_unweighted.x,
+    subproblem_solver=LinearSubproblemSolver(
+        cg_kwargs={"maxiter": max_inner_iter, "M": preconditioner(f, C, rho)}
+    ),
     verbose=True,
 )
 admm_weighted.solve()
@@ -22,9 +22,12 @@ import glob
 import os
 import tempfile
 import zipfile
+from functools import partial
 
 import numpy as np
 
+import jax
+
 import imageio
 
 import scico.numpy as snp
@@ -39,23 +42,25 @@ Define helper functions.
 def volread(path, ext="tif"):
     """Read a 3D volume from a set of files in the specified directory"""
 
-    slices = []
-    for file in sorted(glob.glob(os.path.join(path, "*." + ext))):
-        image = imageio.imread(file)
-        slices.append(image)
-    return np.dstack(slices)
+    files = sorted(glob.glob(os.path.join(path, "*." + ext)))
+    # the first slice determines the shape and dtype of the volume
+    image = imageio.imread(files[0])
+    vol = np.empty(image.shape + (len(files),), dtype=image.dtype)
+    vol[..., 0] = image
+    for i, file in enumerate(files[1:], start=1):
+        vol[..., i] = imageio.imread(file)
+    return vol
 
 
+@partial(jax.jit, static_argnums=1)
 def block_avg(im, N):
     """
     Average distinct NxNxN blocks of im, return the resulting smaller image
     """
 
-    im = snp.mean(snp.reshape(im, (-1, N, im.shape[1], im.shape[2])), axis=1)
-    im = snp.mean(snp.reshape(im, (im.shape[0], -1, N, im.shape[2])), axis=2)
-    im = snp.mean(snp.reshape(im, (im.shape[0], im.shape[1], -1, N)), axis=3)
-
-    return im
+    # split each axis into (blocks, N) and average over all block axes at once
+    shape = (im.shape[0] // N, N, im.shape[1] // N, N, im.shape[2] // N, N)
+    return snp.mean(snp.reshape(im, shape), axis=(1, 3, 5))
 
 
 """
@@ -113,7 +118,7 @@ Pad data and create mask.
 
 padding = [[0, p] for p in snp.array(psf.shape) - 1]
 y_pad = snp.pad(y, padding)
-mask = snp.pad(snp.ones_like(y), padding)
+mask = snp.zeros(y_pad.shape, dtype=y.dtype).at[: y.shape[0], : y.shape[1], : y.shape[2]].set(1.0)
 
 
 """
@@ -147,7 +152,10 @@ g2 = functional.NonNegativeIndicator()  # Non-negativity constraint
 
 
 """
-Set up ADMM solver object and solve problem.
+Set up ADMM solver object and solve problem. Since the mask $M$ is included in $g_0$,
+rather than in $f$, the $\mathbf{x}$-update only involves the circular convolutions
+$C_0$, $C_1$, and $C_2$, and is therefore solved exactly in the DFT domain by
+[admm.CircularConvolveSolver](../_autosummary/scico.admm.rst#scico.admm.CircularConvolveSolver).
 """
 ##
 solver = ADMM(
@@ -179,32 +187,19 @@ def make_slices(x, sep_width=10):
     """
     Make an image with xy, xz, and yz slices from an input volume.
     """
-    fill_val = -1.0
-    out = snp.concatenate(
-        (
-            x[:, :, x.shape[2] // 2],
-            snp.full((x.shape[0], sep_width), fill_val),
-            x[:, x.shape[1] // 2, :],
-        ),
-        axis=1,
+    xy = x[:, :, x.shape[2] // 2]
+    xz = x[:, x.shape[1] // 2, :]
+    yz = x[x.shape[0] // 2, :, :].T
+    fill_val = snp.max(snp.array([xy.max(), xz.max(), yz.max()]))
+
+    out = snp.full(
+        (x.shape[0] + sep_width + x.shape[2], x.shape[1] + sep_width + x.shape[2]),
+        fill_val,
+        dtype=x.dtype,
     )
-
-    out = snp.concatenate(
-        (
-            out,
-            snp.full((sep_width, out.shape[1]), fill_val),
-            snp.concatenate(
-                (
-                    x[x.shape[0] // 2, :, :].T,
-                    snp.full((x.shape[2], x.shape[2] + sep_width), fill_val),
-                ),
-                axis=1,
-            ),
-        ),
-        axis=0,
-    )
-
-    out = snp.where(out == fill_val, out.max(), out)
+    out = out.at[: x.shape[0], : x.shape[1]].set(xy)
+    out = out.at[: x.shape[0], x.shape[1] + sep_width :].set(xz)
+    out = out.at[x.shape[0] + sep_width :, : x.shape[1]].set(yz)
 
     return out
 
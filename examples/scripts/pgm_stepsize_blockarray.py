@@ -15,6 +15,8 @@ This example demonstrates the use of class [pgm.PGMStepSize](../_autosummary/sci
 where $A$ is the forward operator (composed as a sum of the application of individual dictionaries), $\mathbf{y}$ is the measurement, $\mathbf{x}$ is the signal reconstruction, and $I(\mathbf{x} \geq 0)$ is the non-negative indicator.
 """
 
+import numpy as np
+
 import jax
 
 import matplotlib.gridspec as gridspec
@@ -32,8 +34,7 @@ from scico.pgm import (
     LineSearchStepSize,
     RobustLineSearchStepSize,
 )
-from scico.typing import Shape
-from scipy.linalg import dft
+from scico.typing import JaxArray, Shape
 
 """
 Construct a dictionary, a reference random reconstruction, and a test measurement signal consisting of the synthesis of the reference reconstruction.
@@ -43,8 +44,11 @@ n = 8  # Dictionary size
 n0 = 2
 n1 = n - n0
 
-# Create dictionary with bump-like features
-D = ((snp.real(dft(m))[1 : n + 1, :m]) ** 12).T
+# Create dictionary with bump-like features: column k is the 12th power of the real part
+# of the DFT basis vector with frequency k + 1, computed directly rather than by
+# constructing the full m x m DFT matrix
+D = np.cos(2 * np.pi * np.outer(np.arange(m), np.arange(1, n + 1)) / m) ** 12
+D = jax.device_put(D.astype(np.float32))
 D0 = D[:, :n0]
 D1 = D[:, n0:]
 
@@ -52,21 +56,22 @@ D1 = D[:, n0:]
 class MatrixAdd(Operator):
     def __init__(self, input_shape: Shape, D0, D1, jit: bool = True):
 
-        self.D0 = D0
-        self.D1 = D1
+        # A(x) = D0 x[0] + D1 x[1] is a single matrix-vector product of the concatenated
+        # dictionaries with the concatenated blocks of x
+        self.D = snp.concatenate((D0, D1), axis=1)
 
         output_shape = (D0.shape[0],)
 
         super().__init__(
             input_shape=input_shape,
-            input_dtype=snp.complex64,
-            output_dtype=snp.complex64,
+            input_dtype=snp.float32,
+            output_dtype=snp.float32,
             output_shape=output_shape,
             jit=jit,
         )
 
-    def _eval(self, x: BlockArray) -> BlockArray:
-        return D0 @ x[0] + D1 @ x[1]
+    def _eval(self, x: BlockArray) -> JaxArray:
+        return self.D @ x.ravel()
 
 
 x_gt, key = scico.random.uniform(((n0,), (n1,)), seed=12345)  # true coefficients
@@ -98,7 +103,7 @@ Define plotting functionality.
 """
 
 
-def plot_results(hist, str_ss, L0, xsol, xgt, Aop):
+def plot_results(hist, str_ss, L0, xsol, xgt, yobs, Axgt, Aop):
     # Plot signal, coefficients and convergence statistics.
     fig = plot.figure(
         figsize=(12, 6),
@@ -142,15 +147,15 @@ def plot_results(hist, str_ss, L0, xsol, xgt, Aop):
     )
 
     ax3 = fig.add_subplot(gs[1, 0])
-    plt.stem(snp.concatenate((xgt[0], xgt[1])), linefmt="C1-", markerfmt="C1o", basefmt="C1-")
-    plt.stem(snp.concatenate((xsol[0], xsol[1])), linefmt="C2-", markerfmt="C2x", basefmt="C1-")
+    plt.stem(np.asarray(xgt.ravel()), linefmt="C1-", markerfmt="C1o", basefmt="C1-")
+    plt.stem(np.asarray(xsol.ravel()), linefmt="C2-", markerfmt="C2x", basefmt="C1-")
     plt.legend(["Ground Truth", "Recovered"])
     plt.xlabel("Index")
     plt.title("Coefficients")
 
     ax4 = fig.add_subplot(gs[1, 1:])
     plot.plot(
-        snp.vstack((y, Aop(xgt), Aop(xsol))).T,
+        snp.vstack((yobs, Axgt, Aop(xsol))).T,
         title="Fit",
         xlbl="Index",
         lgnd=("y", "A(x_gt)", "A(x)"),
@@ -161,127 +166,48 @@ def plot_results(hist, str_ss, L0, xsol, xgt, Aop):
 
 
 """
-Use default PGMStepSize object, set L0 based on norm of Forward operator and set up AcceleratedPGM solver object. Run the solver and plot the recontructed signal and convergence statistics.
+Compute an estimate of L0 based on the norm of the forward operator, for use with the default PGMStepSize object.
 """
-L0 = (snp.linalg.norm(D0, 2) + snp.linalg.norm(D1, 2)) ** 2
-str_L0 = "(Estimation based on norm of Forward operator)"
-
-solver = AcceleratedPGM(
-    f=f,
-    g=g,
-    L0=L0,
-    x0=x0,
-    maxiter=maxiter,
-    verbose=True,
-)
-str_ss = type(solver.step_size).__name__
-
-print("============================================================")
-print("Running solver with step size of class: ", str_ss)
-print("L0 " + str_L0 + ": ", L0, "\n")
 
-x = solver.solve()  # Run the solver.
-hist = solver.itstat_object.history(transpose=True)
-plot_results(hist, str_ss, L0, x, x_gt, A)
 
-"""
-Use BBStepSize object, set L0 with arbitary initial value and set up AcceleratedPGM solver object. Run the solver and plot the recontructed signal and convergence statistics.
-"""
-L0 = 90.0  # initial reciprocal of gradient descent step size
-str_L0 = "(Arbitrary Initialization)"
-
-solver = AcceleratedPGM(
-    f=f,
-    g=g,
-    L0=L0,
-    x0=x0,
-    maxiter=maxiter,
-    verbose=True,
-    step_size=BBStepSize(),
-)
-str_ss = type(solver.step_size).__name__
+def spectral_norm(M):
+    # Spectral norm of a tall matrix, computed on the host from the largest eigenvalue of
+    # its small Gram matrix rather than from an SVD of the matrix itself.
+    M = np.asarray(M)
+    return np.sqrt(np.linalg.eigvalsh(M.T @ M)[-1])
 
-print("===================================================")
-print("Running solver with step size of class: ", str_ss)
-print("L0 " + str_L0 + ": ", L0, "\n")
 
-x = solver.solve()  # Run the solver.
-hist = solver.itstat_object.history(transpose=True)
-plot_results(hist, str_ss, L0, x, x_gt, A)
+L0_norm = float((spectral_norm(D0) + spectral_norm(D1)) ** 2)
 
 """
-Use AdaptiveBBStepSize object, set L0 with arbitary initial value and set up AcceleratedPGM solver object. Run the solver and plot the recontructed signal and convergence statistics.
+Set up an AcceleratedPGM solver object for each of the step size strategies: the default PGMStepSize object with L0 based on the norm of the forward operator, and the BBStepSize, AdaptiveBBStepSize, LineSearchStepSize, and RobustLineSearchStepSize objects with an arbitrary initial value of L0 (the initial reciprocal of the gradient descent step size). Run each solver and plot the recontructed signal and convergence statistics.
 """
-L0 = 90.0  # initial reciprocal of gradient descent step size
-str_L0 = "(Arbitrary Initialization)"
-
-solver = AcceleratedPGM(
-    f=f,
-    g=g,
-    L0=L0,
-    x0=x0,
-    maxiter=maxiter,
-    verbose=True,
-    step_size=AdaptiveBBStepSize(kappa=0.75),
-)
-str_ss = type(solver.step_size).__name__
-
-print("===========================================================")
-print("Running solver with step size of class: ", str_ss)
-print("L0 " + str_L0 + ": ", L0, "\n")
+configs = [
+    (None, L0_norm, "(Estimation based on norm of Forward operator)"),
+    (BBStepSize(), 90.0, "(Arbitrary Initialization)"),
+    (AdaptiveBBStepSize(kappa=0.75), 90.0, "(Arbitrary Initialization)"),
+    (LineSearchStepSize(), 90.0, "(Arbitrary Initialization)"),
+    (RobustLineSearchStepSize(), 90.0, "(Arbitrary Initialization)"),
+]
 
-x = solver.solve()  # Run the solver.
-hist = solver.itstat_object.history(transpose=True)
-plot_results(hist, str_ss, L0, x, x_gt, A)
-
-"""
-Use LineSearchStepSize object, set L0 with arbitary initial value and set up AcceleratedPGM solver object. Run the solver and plot the recontructed signal and convergence statistics.
-"""
-L0 = 90.0  # initial reciprocal of gradient descent step size
-str_L0 = "(Arbitrary Initialization)"
-
-solver = AcceleratedPGM(
-    f=f,
-    g=g,
-    L0=L0,
-    x0=x0,
-    maxiter=maxiter,
-    verbose=True,
-    step_size=LineSearchStepSize(),
-)
-str_ss = type(solver.step_size).__name__
-
-print("===========================================================")
-print("Running solver with step size of class: ", str_ss)
-print("L0 " + str_L0 + ": ", L0, "\n")
-
-x = solver.solve()  # Run the solver.
-hist = solver.itstat_object.history(transpose=True)
-plot_results(hist, str_ss, L0, x, x_gt, A)
-
-"""
-Use RobustLineSearchStepSize object, set L0 with arbitary initial value and set up AcceleratedPGM solver object. Run the solver and plot the recontructed signal and convergence statistics.
-"""
-L0 = 90.0  # initial reciprocal of gradient descent step size
-str_L0 = "(Arbitrary Initialization)"
-
-solver = AcceleratedPGM(
-    f=f,
-    g=g,
-    L0=L0,
-    x0=x0,
-    maxiter=maxiter,
-    verbose=True,
-    step_size=RobustLineSearchStepSize(),
-)
-str_ss = type(solver.step_size).__name__
+for step_size, L0, str_L0 in configs:
+    solver = AcceleratedPGM(
+        f=f,
+        g=g,
+        L0=L0,
+        x0=x0,
+        maxiter=maxiter,
+        verbose=True,
+        step_size=step_size,
+    )
+    str_ss = type(solver.step_size).__name__
 
-print("=================================================================")
-print("Running solver with step size of class: ", str_ss)
-print("L0 " + str_L0 + ": ", L0, "\n")
+    print("=" * (42 + len(str_ss)))
+    print("Running solver with step size of class: ", str_ss)
+    print("L0 " + str_L0 + ": ", L0, "\n")
 
-x = solver.solve()  # Run the solver.
-hist = solver.itstat_object.history(transpose=True)
-plot_results(hist, str_ss, L0, x, x_gt, A)
+    x = solver.solve()  # Run the solver.
+    hist = solver.itstat_object.history(transpose=True)
+    plot_results(hist, str_ss, L0, x, x_gt, y, lam, A)
 
 input("\nWaiting for input to close figures and exit")
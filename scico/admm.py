@@ -132,6 +132,8 @@ class LinearSubproblemSolver(SubproblemSolver):
            :func:`jax.scipy.sparse.linalg.cg`)
         lhs (type): Function implementing the linear operator needed for the :math:`\mb{x}`
            update step
+        rhs_f (array): Contribution of :math:`f` to the right hand side of the
+           :math:`\mb{x}` update step, :math:`A^* W \mb{y}` (scaled by the loss scale).
     """
 
     def __init__(self, cg_kwargs: dict = {"maxiter": 100}, cg_function: str = "scico"):
@@ -183,6 +185,24 @@ class LinearSubproblemSolver(SubproblemSolver):
         lhs_op.jit()
         self.lhs_op = lhs_op
 
+        # the contribution of f to the right hand side does not depend on the ADMM
+        # iterates, so it is computed once here rather than in every call to compute_rhs
+        if admm.f is not None:
+            if isinstance(admm.f, WeightedSquaredL2Loss):
+                ATWy = admm.f.A.adj(admm.f.weight_op @ admm.f.y)
+                self.rhs_f = 2.0 * admm.f.scale * ATWy
+            else:
+                ATy = admm.f.A.adj(admm.f.y)
+                self.rhs_f = 2.0 * admm.f.scale * ATy
+
+        # a new function is jitted each time the solver is attached to an ADMM object, and
+        # stored under a separate attribute rather than rebinding _compute_rhs, so that a
+        # solver reused for another problem does not reuse a trace of the previous one
+        def compute_rhs(z_list, u_list):
+            return self._compute_rhs(z_list, u_list)
+
+        self._compute_rhs_jit = jax.jit(compute_rhs)
+
     def compute_rhs(self) -> Union[JaxArray, BlockArray]:
         r"""Compute the right hand side of the linear equation to be solved.
 
@@ -195,21 +215,20 @@ class LinearSubproblemSolver(SubproblemSolver):
         Returns:
             Computed solution.
         """
+        return self._compute_rhs_jit(self.admm.z_list, self.admm.u_list)
 
+    def _compute_rhs(
+        self, z_list: List[Union[JaxArray, BlockArray]], u_list: List[Union[JaxArray, BlockArray]]
+    ) -> Union[JaxArray, BlockArray]:
+        # Pure function of the ADMM auxiliary variables, so that it can be jitted
+        # in internal_init and then reused at every iteration.
         C0 = self.admm.C_list[0]
         rhs = snp.zeros(C0.input_shape, C0.input_dtype)
 
         if self.admm.f is not None:
-            if isinstance(self.admm.f, WeightedSquaredL2Loss):
-                ATWy = self.admm.f.A.adj(self.admm.f.weight_op @ self.admm.f.y)
-                rhs += 2.0 * self.admm.f.scale * ATWy
-            else:
-                ATy = self.admm.f.A.adj(self.admm.f.y)
-                rhs += 2.0 * self.admm.f.scale * ATy
+            rhs += self.rhs_f
 
-        for rhoi, Ci, zi, ui in zip(
-            self.admm.rho_list, self.admm.C_list, self.admm.z_list, self.admm.u_list
-        ):
+        for rhoi, Ci, zi, ui in zip(self.admm.rho_list, self.admm.C_list, z_list, u_list):
             rhs = rhs + rhoi * Ci.adj(zi - ui)
         return rhs
 
@@ -217,7 +236,9 @@ class LinearSubproblemSolver(SubproblemSolver):
         """Solve the ADMM step.
 
         Args:
-            x0: Starting point.
+            x0: Initial value for the CG solver. When called from :meth:`.ADMM.x_step`,
+                this is the current :math:`\mb{x}` iterate, i.e. the solution of the
+                previous ADMM step, so that the CG solver is warm-started.
 
         Returns:
             Computed solution.
@@ -239,7 +260,10 @@ class CircularConvolveSolver(LinearSubproblemSolver):
 
     Attributes:
         admm (:class:`.ADMM`): ADMM solver object to which the solver is attached.
-        lhs_f (array): Left hand side, in the DFT domain, of the linear equation to be solved.
+        A_lhs (:class:`.CircularConvolve`): Left hand side operator of the linear equation to
+           be solved.
+        lhs_dft_inv (array): Reciprocal of the DFT of :code:`A_lhs` (only the non-redundant
+           half of the DFT when the solution is real).
     """
 
     def __init__(self):
@@ -271,6 +295,14 @@ class CircularConvolveSolver(LinearSubproblemSolver):
             A_lhs += 2.0 * admm.f.scale * CircularConvolve.from_operator(admm.f.A.gram_op)
 
         self.A_lhs = A_lhs
+        lhs_dft = A_lhs.h_dft
+        if self.real_result:
+            # A_lhs is a real operator, so its DFT is Hermitian and the solution can be
+            # computed via real-input DFTs using the non-redundant half of its DFT
+            lhs_dft = lhs_dft[..., : lhs_dft.shape[-1] // 2 + 1]
+        # the left hand side is fixed, so its inverse is computed once here rather than
+        # in every call to solve
+        self.lhs_dft_inv = 1.0 / lhs_dft
 
     def solve(self, x0: Union[JaxArray, BlockArray]) -> Union[JaxArray, BlockArray]:
         """Solve the ADMM step.
@@ -283,11 +315,14 @@ class CircularConvolveSolver(LinearSubproblemSolver):
         """
         x0 = ensure_on_device(x0)
         rhs = self.compute_rhs()
+        if self.real_result:
+            fft_axes = self.A_lhs.x_fft_axes
+            rhs_dft = snp.fft.rfftn(rhs, axes=fft_axes)
+            x_dft = rhs_dft * self.lhs_dft_inv
+            return snp.fft.irfftn(x_dft, s=[rhs.shape[k] for k in fft_axes], axes=fft_axes)
         rhs_dft = snp.fft.fftn(rhs, axes=self.A_lhs.x_fft_axes)
-        x_dft = rhs_dft / self.A_lhs.h_dft
+        x_dft = rhs_dft * self.lhs_dft_inv
         x = snp.fft.ifftn(x_dft, axes=self.A_lhs.x_fft_axes)
-        if self.real_result:
-            x = x.real
 
         return x
 
@@ -327,7 +362,10 @@ class ADMM:
     For documentation on minimization with respect to :math:`\mb{x}`, see :meth:`x_step`.
 
     For documentation on minimization with respect to :math:`\mb{z}_i` and
-    :math:`\mb{u}_i`, see :meth:`z_and_u_step`.
+    :math:`\mb{u}_i`, see :meth:`z_and_u_step`. Since the :math:`\mb{z}_i` and
+    :math:`\mb{u}_i` updates are jit compiled, the :meth:`~.Functional.prox` methods of the
+    :math:`g_i` must be traceable by :func:`jax.jit`, i.e. they may not use Python control
+    flow that depends on the values of their array arguments.
 
 
     Attributes:
@@ -365,7 +403,8 @@ class ADMM:
         Args:
             f : Loss function
             g_list : List of :math:`g_i`
-                functionals. Must be same length as :code:`C_list` and :code:`rho_list`
+                functionals. Must be same length as :code:`C_list` and :code:`rho_list`.
+                Their :meth:`~.Functional.prox` methods must be traceable by :func:`jax.jit`.
             C_list : List of :math:`C_i` operators
             rho_list : List of :math:`\rho_i` penalty parameters.
                 Must be same length as :code:`C_list` and :code:`g_list`
@@ -442,6 +481,12 @@ class ADMM:
         self.z_list, self.z_list_old = self.z_init(self.x)
         self.u_list = self.u_init(self.x)
 
+        # The buffers of the u_i (argument 1) are donated so that the updated u_i can be
+        # written in place. Donation is not supported on CPU, where it would only result in
+        # a warning.
+        donate_argnums = (1,) if jax.devices()[0].platform != "cpu" else ()
+        self._z_and_u_update = jax.jit(self._z_and_u_update, donate_argnums=donate_argnums)
+
     def objective(
         self,
         x: Optional[Union[JaxArray, BlockArray]] = None,
@@ -571,22 +616,30 @@ class ADMM:
         .. math::
             \mb{u}_i^{(k+1)} =  \mb{u}_i^{(k)} + C_i \mb{x}^{(k+1)} - \mb{z}^{(k+1)}_i
 
+        Note that, except when running on CPU, the arrays in :code:`u_list` are donated to
+        the update computation and may not be used after calling this method.
         """
         z_list_old = z_list.copy()
+        z_list, u_list = self._z_and_u_update(self.x, u_list)
+        return u_list, z_list, z_list_old
 
-        # unpack the arrays that will be changing to prevent side-effects
-        z_list = self.z_list
-        u_list = self.u_list
-
-        for i, (rhoi, fi, Ci, zi, ui) in enumerate(
-            zip(self.rho_list, self.g_list, self.C_list, z_list, u_list)
-        ):
-            Cix = Ci(self.x)
+    def _z_and_u_update(
+        self,
+        x: Union[JaxArray, BlockArray],
+        u_list: List[Union[JaxArray, BlockArray]],
+    ) -> Tuple[List[Union[JaxArray, BlockArray]], List[Union[JaxArray, BlockArray]]]:
+        # Pure function implementing the computations of z_and_u_step; jitted in
+        # __init__ so that the C_i, prox, and update operations of all terms are
+        # compiled into a single function.
+        z_list_new = []
+        u_list_new = []
+        for rhoi, fi, Ci, ui in zip(self.rho_list, self.g_list, self.C_list, u_list):
+            Cix = Ci(x)
             zi = fi.prox(Cix + ui, 1 / rhoi)
             ui = ui + Cix - zi
-            z_list[i] = zi
-            u_list[i] = ui
-        return u_list, z_list, z_list_old
+            z_list_new.append(zi)
+            u_list_new.append(ui)
+        return z_list_new, u_list_new
 
     def step(self):
         """Perform a single ADMM iteration.
@@ -84,6 +84,10 @@ is_smooth = {self.is_smooth}
 
         where :math:`f(\mb{v})` represents this functional evaluated at :math:`\mb{v}`.
 
+        Implementations should be traceable by :func:`jax.jit` (i.e. they should not use
+        Python control flow that depends on the values of `x` or `lam`), since some solvers,
+        including :class:`.ADMM`, evaluate the prox within jit compiled functions.
+
         Args:
             x : Point at which to evaluate prox function.
             lam : Proximal parameter :math:`\lambda`
@@ -71,6 +71,7 @@ class L1Norm(Functional):
         return snp.abs(x).sum()
 
     @staticmethod
+    @jit
     def prox(x: Union[JaxArray, BlockArray], lam: float) -> JaxArray:
         r"""Evaluate proximal operator of :math:`\ell_1` norm
 
@@ -88,8 +89,7 @@ class L1Norm(Functional):
 
 
         """
-        tmp = snp.abs(x) - lam
-        tmp = 0.5 * (tmp + snp.abs(tmp))
+        tmp = snp.maximum(snp.abs(x) - lam, 0)
         if snp.iscomplexobj(x):
             out = snp.exp(1j * snp.angle(x)) * tmp
         else:
@@ -162,10 +162,9 @@ class L2Norm(Functional):
             lam : Proximal parameter :math:`\lambda`
         """
         norm_x = norm(x)
-        if norm_x == 0:
-            return 0 * x
-        else:
-            return snp.maximum(1 - lam / norm_x, 0) * x
+        # safe_divide avoids an `if` on the value of norm_x so that this can be jitted;
+        # when norm_x is 0, x is also 0 and the result is 0 as required
+        return snp.maximum(1 - safe_divide(lam, norm_x), 0) * x
 
 
 class L21Norm(Functional):
@@ -218,10 +217,8 @@ class L21Norm(Functional):
         """
 
         length = norm(x, axis=self.l2_axis, keepdims=True)
-        direction = safe_divide(x, length)
-
-        new_length = length - lam
-        # set negative values to zero without `if`
-        new_length = 0.5 * (new_length + snp.abs(new_length))
+        # compute the shrinkage factor on the reduced array so that the full size array is
+        # only scaled once, rather than being normalized and then rescaled
+        scale = safe_divide(snp.maximum(length - lam, 0), length)
 
-        return new_length * direction
+        return scale * x
@@ -148,6 +148,11 @@ class CircularConvolve(LinearOperator):
         self.ifft_axes = list(range(len(output_shape) - self.ndims, len(output_shape)))
         self.x_fft_axes = list(range(len(input_shape) - self.ndims, len(input_shape)))
 
+        if self.real:
+            # When the output is real, the input is also real, and the operator can be
+            # evaluated using real-input DFTs, which only require half of the DFT of h
+            self._h_rdft = _hermitian_half_dft(self.h_dft, self.ndims)
+
         super().__init__(
             input_shape=input_shape,
             output_shape=output_shape,
@@ -159,16 +164,29 @@ class CircularConvolve(LinearOperator):
 
     def _eval(self, x: JaxArray) -> JaxArray:
         x = x.astype(self.input_dtype)
+        if self.real:
+            x_dft = snp.fft.rfftn(x, axes=self.x_fft_axes)
+            return snp.fft.irfftn(
+                self._h_rdft * x_dft,
+                s=self.input_shape[-self.ndims :],
+                axes=self.ifft_axes,
+            )
         x_dft = snp.fft.fftn(x, axes=self.x_fft_axes)
         hx = snp.fft.ifftn(
             self.h_dft * x_dft,
             axes=self.ifft_axes,
         )
-        if self.real:
-            hx = hx.real
         return hx
 
     def _adj(self, x: JaxArray) -> JaxArray:
+        if self.real:
+            x_dft = snp.fft.rfftn(x, axes=self.ifft_axes)
+            H_adj_x = snp.fft.irfftn(
+                snp.conj(self._h_rdft) * x_dft,
+                s=self.input_shape[-self.ndims :],
+                axes=self.ifft_axes,
+            )
+            return snp.sum(H_adj_x, axis=self.batch_axes)  # adjoint of the broadcast
         x_dft = snp.fft.fftn(x, axes=self.ifft_axes)
         H_adj_x = snp.fft.ifftn(
             snp.conj(self.h_dft) * x_dft,
@@ -176,8 +194,6 @@ class CircularConvolve(LinearOperator):
             s=self.input_shape[-self.ndims :],
         )
         H_adj_x = snp.sum(H_adj_x, axis=self.batch_axes)  # adjoint of the broadcast
-        if self.real:
-            H_adj_x = H_adj_x.real
         return H_adj_x
 
     @partial(_wrap_add_sub, op=operator.add)
@@ -269,6 +285,28 @@ class CircularConvolve(LinearOperator):
         )
 
 
+def _hermitian_half_dft(h_dft: JaxArray, ndims: int) -> JaxArray:
+    r"""Compute the non-redundant half of the Hermitian part of a DFT.
+
+    For real :math:`\mb{x}`, the real part of the inverse DFT of :math:`\hat{h} \hat{x}`
+    only depends on the Hermitian part :math:`(\hat{h}(k) + \hat{h}(-k)^*) / 2` of
+    :math:`\hat{h}`, and can be computed via real-input DFTs from the first
+    :math:`n // 2 + 1` entries of this Hermitian part along the last axis.
+
+    Args:
+        h_dft: Array of DFTs, with the DFT axes being the final `ndims` axes.
+        ndims: Number of (trailing) DFT axes.
+
+    Returns:
+        The non-redundant half of the Hermitian part of `h_dft`.
+    """
+    axes = tuple(range(-ndims, 0))
+    # index k -> -k (modulo the axis length) on each DFT axis
+    h_neg = snp.roll(snp.flip(h_dft, axis=axes), 1, axis=axes)
+    h_herm = 0.5 * (h_dft + snp.conj(h_neg))
+    return h_herm[..., : h_dft.shape[-1] // 2 + 1]
+
+
 def _gradient_filters(ndim: int, axes: Shape, shape: Shape, dtype: DType = snp.float32) -> JaxArray:
     r"""Construct a set of filters for computing gradients in the frequency domain.
 
@@ -13,6 +13,9 @@ from copy import copy
 from functools import wraps
 from typing import Callable, Optional, Union
 
+import jax
+
+import scico
 import scico.numpy as snp
 from scico import functional, linop, operator
 from scico.blockarray import BlockArray
@@ -44,6 +47,11 @@ class Loss(functional.Functional):
     .. math::
         \mathrm{scale} \cdot l(\mb{y}, A(\mb{x})) \;
 
+    The gradient is jit compiled on its first evaluation, at which point the
+    values of attributes such as :code:`y` and :code:`A` are fixed in the
+    compiled function. These attributes should therefore not be modified after
+    the gradient has been evaluated; a new loss should be constructed instead. The
+    scale should only be modified via :meth:`set_scale`.
     """
 
     def __init__(
@@ -75,6 +83,7 @@ class Loss(functional.Functional):
         self.is_quadratic: bool = False
 
         super().__init__()
+        self._set_grad()
 
     def __call__(self, x: Union[JaxArray, BlockArray]) -> float:
         r"""Evaluate this loss at point :math:`\mb{x}`.
@@ -102,6 +111,15 @@ class Loss(functional.Functional):
     def set_scale(self, new_scale: float):
         r"""Update the scale attribute."""
         self.scale = new_scale
+        # The compiled gradient depends on the scale, and scaled losses are constructed
+        # as (shallow) copies, so the gradient of this object is reconstructed here.
+        self._set_grad()
+
+    def _set_grad(self):
+        # The gradient is evaluated repeatedly by iterative solvers, so it is jit
+        # compiled rather than traced on every call. It is bound to this object, so
+        # that copies of a loss do not share the gradient of the original.
+        self._grad = jax.jit(scico.grad(self.__call__))
 
 
 class SquaredL2Loss(Loss):
@@ -120,7 +138,7 @@ class SquaredL2Loss(Loss):
         scale: float = 0.5,
     ):
         y = ensure_on_device(y)
-        self.functional = scale * functional.SquaredL2Norm()
+        self.functional = functional.SquaredL2Norm()
         super().__init__(y=y, A=A, scale=scale)
 
         if isinstance(A, operator.Operator):
@@ -140,7 +158,7 @@ class SquaredL2Loss(Loss):
         Args:
             x : Point at which to evaluate loss.
         """
-        return self.functional(self.y - self.A(x))
+        return self.scale * self.functional(self.y - self.A(x))
 
     def prox(self, x: Union[JaxArray, BlockArray], lam: float) -> Union[JaxArray, BlockArray]:
         if isinstance(self.A, linop.Diagonal):
@@ -201,7 +219,7 @@ class WeightedSquaredL2Loss(Loss):
 
         self.weight_op: operator.Operator
 
-        self.functional = scale * functional.SquaredL2Norm()
+        self.functional = functional.SquaredL2Norm()
         if weight_op is None:
             self.weight_op = linop.Identity(y.shape)
         elif isinstance(weight_op, linop.LinearOperator):
@@ -222,7 +240,7 @@ class WeightedSquaredL2Loss(Loss):
             self.has_prox = True
 
     def __call__(self, x: Union[JaxArray, BlockArray]) -> float:
-        return self.functional(self.weight_op(self.y - self.A(x)))
+        return self.scale * self.functional(self.weight_op(self.y - self.A(x)))
 
     def prox(self, x: Union[JaxArray, BlockArray], lam: float) -> Union[JaxArray, BlockArray]:
         if isinstance(self.A, linop.Diagonal):
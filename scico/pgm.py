@@ -501,6 +501,17 @@ class AcceleratedPGM(PGM):
         self.v = x0
         self.t = 1.0
 
+        def accelerated_update(x, v, L, t):
+            # Update of the solution, fixed point residual, and extrapolation, compiled
+            # as a single function so that these computations involve a single dispatch.
+            x_new = self.x_step(v, L)
+            residual = snp.linalg.norm(x_new - v)
+            t_new = 0.5 * (1 + snp.sqrt(1 + 4 * t ** 2))
+            v_new = x_new + ((t - 1) / t_new) * (x_new - x)
+            return x_new, residual, t_new, v_new
+
+        self.accelerated_update = jax.jit(accelerated_update)
+
     def step(self):
         """Take a single AcceleratedPGM step"""
         x_old = self.x
@@ -515,12 +526,9 @@ class AcceleratedPGM(PGM):
             self.x = self.step_size.Z
             self.fixed_point_residual = snp.linalg.norm(self.x - x_old)
         else:
-            self.x = self.x_step(self.v, self.L)
-
-            self.fixed_point_residual = snp.linalg.norm(self.x - self.v)
-            t_old = self.t
-            self.t = 0.5 * (1 + snp.sqrt(1 + 4 * t_old ** 2))
-            self.v = self.x + ((t_old - 1) / self.t) * (self.x - x_old)
+            self.x, self.fixed_point_residual, self.t, self.v = self.accelerated_update(
+                x_old, self.v, self.L, self.t
+            )
 
     def solve(self):
         """Take a sequence of `maxiter` PGM steps"""
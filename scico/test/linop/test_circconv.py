@@ -138,3 +138,35 @@ class TestCircularConvolve:
         B = CircularConvolve.from_operator(A, ndims, jit=jit_new_op)
 
         np.testing.assert_allclose(A @ x, B @ x, atol=1e-5)
+
+    @pytest.mark.parametrize("jit", [True, False])
+    @pytest.mark.parametrize("h_type", ["h_center", "complex_dft"])
+    @pytest.mark.parametrize("axes_shape_spec", SHAPE_SPECS)
+    def test_real_non_hermitian(self, axes_shape_spec, h_type, jit):
+        # real input with a DFT of h that is not Hermitian: the operator should be the
+        # real part of the complex circular convolution
+        x_shape, ndims, h_shape = axes_shape_spec
+        input_dtype = np.float32
+        nd = len(x_shape) if ndims is None else ndims
+
+        if h_type == "h_center":
+            # fractional center, as used for even size PSFs
+            h, key = randn(tuple(h_shape), dtype=input_dtype, key=self.key)
+            h_center = snp.array(h_shape[-nd:]) / 2 - 0.5
+            A = CircularConvolve(h, x_shape, ndims, input_dtype, h_center=h_center, jit=jit)
+        else:
+            dft_shape = tuple(h_shape[:-nd]) + tuple(x_shape[-nd:])
+            h_dft, key = randn(dft_shape, dtype=np.complex64, key=self.key)
+            A = CircularConvolve(h_dft, x_shape, ndims, input_dtype, h_is_dft=True, jit=jit)
+
+        H = np.asarray(A.h_dft)
+        axes = tuple(range(-A.ndims, 0))
+
+        x, key = randn(tuple(x_shape), dtype=input_dtype, key=key)
+        Ax = np.fft.ifftn(H * np.fft.fftn(np.asarray(x), axes=axes), axes=axes).real
+        np.testing.assert_allclose(A @ x, Ax, rtol=1e-4, atol=1e-4)
+
+        y, key = randn(A.output_shape, dtype=input_dtype, key=key)
+        ATy = np.fft.ifftn(np.conj(H) * np.fft.fftn(np.asarray(y), axes=axes), axes=axes).real
+        ATy = np.sum(ATy, axis=A.batch_axes)
+        np.testing.assert_allclose(A.adj(y), ATy, rtol=1e-4, atol=1e-4)
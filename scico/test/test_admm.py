@@ -94,6 +94,31 @@ class TestReal:
         x = admm_.solve()
         assert (snp.linalg.norm(self.grdA(x) - self.grdb) / snp.linalg.norm(self.grdb)) < 1e-5
 
+    def test_admm_quadratic_reuse_solver(self):
+        # A subproblem solver attached to a second ADMM object must use the data of the
+        # second problem, not that of the first.
+        maxiter = 50
+        A = linop.MatrixOperator(self.Amx)
+        g_list = [(self.λ / 2) * functional.SquaredL2Norm()]
+        C_list = [linop.MatrixOperator(self.Bmx)]
+        subproblem_solver = LinearSubproblemSolver(cg_function="scico")
+        y2 = np.random.randn(*self.y.shape)
+        grdb2 = self.Amx.T @ y2
+        for y, grdb, ρ in ((self.y, self.grdb, 1e0), (y2, grdb2, 2e0)):
+            f = loss.SquaredL2Loss(y=y, A=A)
+            admm_ = ADMM(
+                f=f,
+                g_list=g_list,
+                C_list=C_list,
+                rho_list=[ρ],
+                maxiter=maxiter,
+                verbose=False,
+                x0=A.adj(y),
+                subproblem_solver=subproblem_solver,
+            )
+            x = admm_.solve()
+            assert (snp.linalg.norm(self.grdA(x) - grdb) / snp.linalg.norm(grdb)) < 1e-5
+
 
 class TestComplex:
     def setup_method(self, method):
@@ -155,6 +155,15 @@ class TestNormProx:
         prx = nrmobj.prox
         pf = prox_test(test_prox_obj.vz, nrm, prx, alpha=1.0)
 
+    @pytest.mark.parametrize("norm", normlist)
+    def test_prox_zeros_jit(self, norm, test_prox_obj):
+        # prox must be traceable by jax.jit (as required by ADMM), including at zero
+        nrmobj = norm()
+        pf = nrmobj.prox(test_prox_obj.vz, 1.0)
+        pf_jit = jax.jit(nrmobj.prox)(test_prox_obj.vz, 1.0)
+        np.testing.assert_allclose(pf, pf_jit)
+        assert not np.any(np.isnan(pf_jit))
+
     @pytest.mark.parametrize("norm", normlist)
     def test_scaled_attrs(self, norm, test_prox_obj):
         alpha = np.sqrt(2)
@@ -354,6 +363,24 @@ class TestLoss:
 
         pf = prox_test(self.v, L_d, L_d.prox, 0.75)
 
+    @pytest.mark.parametrize("loss_class", ["squared_l2", "weighted_squared_l2", "poisson"])
+    def test_scaled_grad(self, loss_class):
+        if loss_class == "squared_l2":
+            L = loss.SquaredL2Loss(y=self.y, A=self.Ao)
+            v = self.v
+        elif loss_class == "weighted_squared_l2":
+            L = loss.WeightedSquaredL2Loss(y=self.y, A=self.Ao, weight_op=self.Wo)
+            v = self.v
+        else:
+            A = linop.Diagonal(snp.abs(self.Do.diagonal) + 1.0)
+            L = loss.PoissonLoss(y=snp.abs(self.y), A=A)
+            v = snp.abs(self.v) + 1.0
+
+        L.grad(v)  # scaled loss should not share the compiled gradient of L
+        cL = 2.0 * L
+        np.testing.assert_allclose(cL(v), 2.0 * L(v), rtol=1e-6)
+        np.testing.assert_allclose(cL.grad(v), 2.0 * L.grad(v), rtol=1e-6)
+
 
 class TestBM3D:
     def setup(self):